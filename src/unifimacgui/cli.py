@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import getpass
+import io
 import logging
-from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+import sys
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
 
 from .client import UniFiClient, label_mac_addresses
 
 LOGGER = logging.getLogger(__name__)
 
+EXPORT_BUFFER_SIZE = 1 << 20
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -74,38 +78,113 @@ def run_cli(argv: Sequence[str]) -> int:
     labelled = label_mac_addresses(wlan.mac_filter_list, known_devices)
 
     if args.out:
-        export_results(labelled, args.out, args.format)
-        print(f"Exported {len(labelled)} entries to {args.out} ({args.format}).")
+        count = export_results(labelled, args.out, args.format)
+        print(f"Exported {count} entries to {args.out} ({args.format}).")
     else:
         print_table(labelled)
     return 0
 
 
-def export_results(entries: Iterable[Tuple[str, str]], outfile: str, fmt: str) -> None:
+def export_results(entries: Iterable[Tuple[str, str]], outfile: str, fmt: str) -> int:
+    """Write ``entries`` to ``outfile`` and return the number of rows exported.
+
+    TXT and CSV exports stream straight from the iterable into a buffered file handle,
+    so large filter lists are never held in memory twice.
+    """
+
     fmt = fmt.lower()
-    entries = list(entries)
+    count = 0
     if fmt == "txt":
-        lines = [f"{mac}\t{name}" for mac, name in entries]
-        Path(outfile).write_text("\n".join(lines), encoding="utf-8")
+        with open(outfile, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as handle:
+            for mac, name in entries:
+                if count:
+                    handle.write("\n")
+                handle.write(f"{mac}\t{name}")
+                count += 1
     elif fmt == "csv":
-        import csv
-
-        with open(outfile, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(["MAC", "Name"])
-            writer.writerows(entries)
+        # Hand-rolled equivalent of csv.writer's default dialect for the fixed two-column schema.
+        with open(outfile, "wb", buffering=EXPORT_BUFFER_SIZE) as handle:
+            write = handle.write
+            write(b"MAC,Name\r\n")
+            for mac, name in entries:
+                write(f"{_csv_field(mac)},{_csv_field(name)}\r\n".encode("utf-8"))
+                count += 1
     elif fmt == "xlsx":
-        try:
-            import pandas as pd
-        except ImportError as exc:  # pragma: no cover - depends on optional dependency
-            raise RuntimeError(
-                "pandas and openpyxl are required for XLSX export. Install them via 'pip install pandas openpyxl'."
-            ) from exc
-        data = {"MAC": [mac for mac, _ in entries], "Name": [name for _, name in entries]}
-        df = pd.DataFrame(data)
-        df.to_excel(outfile, index=False)
+        count = _xlsx_writer()(entries, outfile)
     else:  # pragma: no cover - defensive programming
         raise ValueError(f"Unsupported export format: {fmt}")
+    return count
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field the way ``csv.QUOTE_MINIMAL`` would."""
+
+    if "," in value or '"' in value or "\r" in value or "\n" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+XlsxWriter = Callable[[Iterable[Tuple[str, str]], str], int]
+
+
+@functools.lru_cache(maxsize=1)
+def _xlsx_writer() -> XlsxWriter:
+    """Return the export function of the fastest installed XLSX backend.
+
+    Backends are tried in order: ``rustpy_xlsxwriter``, ``xlsxwriter``, then pandas.
+    The choice is cached so repeated exports do not repeat the import probing.
+    """
+
+    try:
+        from rustpy_xlsxwriter import FastExcel
+    except ImportError:
+        pass
+    else:
+        return functools.partial(_write_xlsx_rustpy, FastExcel)
+
+    try:
+        import xlsxwriter
+    except ImportError:
+        pass
+    else:
+        return functools.partial(_write_xlsx_xlsxwriter, xlsxwriter)
+
+    try:
+        import pandas as pd
+    except ImportError as exc:  # pragma: no cover - depends on optional dependency
+        raise RuntimeError(
+            "An XLSX backend is required for XLSX export. Install one via 'pip install xlsxwriter' "
+            "(or 'pip install rustpy-xlsxwriter' for the fastest exports)."
+        ) from exc
+    return functools.partial(_write_xlsx_pandas, pd)
+
+
+def _write_xlsx_rustpy(fast_excel: Any, entries: Iterable[Tuple[str, str]], outfile: str) -> int:
+    records = [{"MAC": mac, "Name": name} for mac, name in entries]
+    fast_excel(outfile).sheet("MAC", records).save()
+    return len(records)
+
+
+def _write_xlsx_xlsxwriter(xlsxwriter: Any, entries: Iterable[Tuple[str, str]], outfile: str) -> int:
+    count = 0
+    # constant_memory flushes each row to disk, keeping memory flat for long lists.
+    workbook = xlsxwriter.Workbook(outfile, {"constant_memory": True, "strings_to_urls": False})
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, ("MAC", "Name"))
+        for count, (mac, name) in enumerate(entries, 1):
+            worksheet.write_string(count, 0, mac)
+            worksheet.write_string(count, 1, name)
+    finally:
+        workbook.close()
+    return count
+
+
+def _write_xlsx_pandas(pd: Any, entries: Iterable[Tuple[str, str]], outfile: str) -> int:
+    rows = list(entries)
+    df = pd.DataFrame(rows, columns=["MAC", "Name"])
+    df.to_excel(outfile, index=False)
+    return len(rows)
 
 
 def print_table(entries: List[Tuple[str, str]]) -> None:
@@ -113,11 +192,16 @@ def print_table(entries: List[Tuple[str, str]]) -> None:
         print("No MAC addresses found.")
         return
 
-    mac_width = max(len(mac) for mac, _ in entries)
-    name_width = max(len(name) for _, name in entries)
-    header = f"{'MAC'.ljust(mac_width)}  {'Name'.ljust(name_width)}"
-    divider = f"{'-' * mac_width}  {'-' * name_width}"
-    print(header)
-    print(divider)
+    mac_width = name_width = 0
+    for mac, name in entries:
+        if len(mac) > mac_width:
+            mac_width = len(mac)
+        if len(name) > name_width:
+            name_width = len(name)
+
+    out = io.StringIO()
+    out.write(f"{'MAC'.ljust(mac_width)}  {'Name'.ljust(name_width)}\n")
+    out.write(f"{'-' * mac_width}  {'-' * name_width}\n")
     for mac, name in entries:
-        print(f"{mac.ljust(mac_width)}  {name.ljust(name_width)}")
+        out.write(f"{mac.ljust(mac_width)}  {name.ljust(name_width)}\n")
+    sys.stdout.write(out.getvalue())
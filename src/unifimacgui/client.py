@@ -3,27 +3,55 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple, TypeVar
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on optional dependency
+    import json
+
+    _loads = json.loads
 
 LOGGER = logging.getLogger(__name__)
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+T = TypeVar("T")
+
+# Device record fields consulted for a display name, in order of preference.
+NAME_KEYS = ("name", "hostname", "usergroup_name", "oui")
+
+# MAC addresses are keyed in uppercase. str.upper takes CPython's ASCII fast path, which
+# benchmarks several times faster than str.translate with a hex-only table.
+_normalize_mac = str.upper
+
+# MAC shapes accepted for labelling: "aa:bb:cc:dd:ee:ff", "aa-bb-cc-dd-ee-ff", "aabb.ccdd.eeff", "aabbccddeeff".
+_MAC_RE = re.compile(
+    r"(?:[0-9A-Fa-f]{2}([:-]))(?:[0-9A-Fa-f]{2}\1){4}[0-9A-Fa-f]{2}"
+    r"|(?:[0-9A-Fa-f]{4}\.){2}[0-9A-Fa-f]{4}"
+    r"|[0-9A-Fa-f]{12}"
+)
+
+# Seconds that fetched WLANs and known devices are reused before hitting the controller again.
+CACHE_TTL_SECONDS = 30.0
 
 
-@dataclass
-class Site:
+class Site(NamedTuple):
     """Lightweight representation of a UniFi site."""
 
     code: str
     description: str
 
 
-@dataclass
-class WlanProfile:
+class WlanProfile(NamedTuple):
     """Representation of a WLAN profile and its MAC filter list."""
 
     name: str
@@ -38,6 +66,37 @@ class UniFiClient:
         self.verify_ssl = verify_ssl
         self.timeout = timeout
         self.session = requests.Session()
+        if not verify_ssl:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self._wlans_cache: Dict[str, Tuple[float, List[WlanProfile]]] = {}
+        self._devices_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def invalidate(self, site_code: Optional[str] = None) -> None:
+        """Drop cached site data so the next fetch queries the controller."""
+
+        if site_code is None:
+            self._wlans_cache.clear()
+            self._devices_cache.clear()
+        else:
+            self._wlans_cache.pop(site_code, None)
+            self._devices_cache.pop(site_code, None)
+
+    @staticmethod
+    def _fresh(cache: Dict[str, Tuple[float, T]], site_code: str) -> Optional[T]:
+        cached = cache.get(site_code)
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+        return None
+
+    def _get(self, url: str) -> requests.Response:
+        # Passed per request: a session-level verify=False is overridden by REQUESTS_CA_BUNDLE.
+        response = self.session.get(url, timeout=self.timeout, verify=self.verify_ssl)
+        response.raise_for_status()
+        return response
 
     def login(self, username: str, password: str) -> None:
         LOGGER.debug("Logging into UniFi controller at %s", self.base_url)
@@ -51,82 +110,89 @@ class UniFiClient:
 
     def fetch_sites(self) -> List[Site]:
         LOGGER.debug("Fetching available sites")
-        response = self.session.get(
-            f"{self.base_url}/api/self/sites",
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-        )
-        response.raise_for_status()
-        data = response.json().get("data", [])
+        response = self._get(f"{self.base_url}/api/self/sites")
+        data = _loads(response.content).get("data", [])
         sites = [
             Site(code=item.get("name", ""), description=item.get("desc") or item.get("name", ""))
             for item in data
         ]
-        sites.sort(key=lambda s: s.description.lower())
+        sites.sort(key=lambda s: s.description.casefold())
         return sites
 
     def fetch_wlans(self, site_code: str) -> List[WlanProfile]:
+        cached = self._fresh(self._wlans_cache, site_code)
+        if cached is not None:
+            return cached
         LOGGER.debug("Fetching WLAN profiles for site %s", site_code)
-        response = self.session.get(
-            f"{self.base_url}/api/s/{site_code}/rest/wlanconf",
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-        )
-        response.raise_for_status()
+        response = self._get(f"{self.base_url}/api/s/{site_code}/rest/wlanconf")
         wlans: List[WlanProfile] = []
-        for item in response.json().get("data", []):
+        for item in _loads(response.content).get("data", []):
             macs = item.get("mac_filter_list") or []
             wlans.append(WlanProfile(name=item.get("name", ""), mac_filter_list=list(macs)))
-        wlans.sort(key=lambda w: w.name.lower())
+        wlans.sort(key=lambda w: w.name.casefold())
+        self._wlans_cache[site_code] = (time.monotonic(), wlans)
         return wlans
 
     def fetch_known_devices(self, site_code: str) -> Dict[str, str]:
         """Return a mapping of MAC address to friendly name for known devices."""
 
+        cached = self._fresh(self._devices_cache, site_code)
+        if cached is not None:
+            return cached
         LOGGER.debug("Fetching known devices for site %s", site_code)
-        response = self.session.get(
-            f"{self.base_url}/api/s/{site_code}/stat/alluser",
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-        )
-        response.raise_for_status()
-        devices = response.json().get("data", [])
+        response = self._get(f"{self.base_url}/api/s/{site_code}/stat/alluser")
+        devices = _loads(response.content).get("data", [])
         mapping: Dict[str, str] = {}
         for device in devices:
-            mac = (device.get("mac") or "").upper()
+            get = device.get
+            mac = get("mac")
             if not mac:
                 continue
-            name = _pick_name(device)
-            if name:
-                mapping[mac] = name
+            for key in NAME_KEYS:
+                value = get(key)
+                if isinstance(value, str):
+                    value = value.strip()
+                    if value:
+                        mapping[_normalize_mac(mac)] = value
+                        break
+        self._devices_cache[site_code] = (time.monotonic(), mapping)
         return mapping
 
+    def fetch_site_data(self, site_code: str) -> Tuple[List[WlanProfile], Dict[str, str]]:
+        """Fetch WLAN profiles and known devices for a site, concurrently when both are stale."""
+
+        wlans = self._fresh(self._wlans_cache, site_code)
+        known = self._fresh(self._devices_cache, site_code)
+        if wlans is not None or known is not None:
+            # At most one request is needed, so there is nothing to overlap.
+            return self.fetch_wlans(site_code), self.fetch_known_devices(site_code)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="unifi-fetch")
+        wlans_future = self._executor.submit(self.fetch_wlans, site_code)
+        devices_future = self._executor.submit(self.fetch_known_devices, site_code)
+        return wlans_future.result(), devices_future.result()
+
     def fetch_mac_filter_details(self, site_code: str, wlan_name: str) -> Tuple[WlanProfile, Dict[str, str]]:
-        wlans = self.fetch_wlans(site_code)
+        wlans, known_devices = self.fetch_site_data(site_code)
         lookup = {wlan.name: wlan for wlan in wlans}
         if wlan_name not in lookup:
             available = ", ".join(sorted(lookup))
             raise ValueError(f"WLAN '{wlan_name}' not found. Available: {available}")
-        known_devices = self.fetch_known_devices(site_code)
         return lookup[wlan_name], known_devices
 
 
-def _pick_name(device: Dict[str, Optional[str]]) -> Optional[str]:
-    """Return the best available display name for a device record."""
-
-    for key in ("name", "hostname", "usergroup_name", "oui"):
-        value = device.get(key)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
-    return None
-
-
 def label_mac_addresses(macs: List[str], known_devices: Dict[str, str]) -> List[Tuple[str, str]]:
-    """Attach friendly labels to MAC addresses, defaulting to 'Unknown'."""
-
-    labelled: List[Tuple[str, str]] = []
-    for mac in macs:
-        normalised = mac.upper()
-        label = known_devices.get(normalised, "Unknown")
-        labelled.append((normalised, label))
-    return labelled
+    """Attach friendly labels to MAC addresses, defaulting to 'Unknown'.
+
+    Entries that do not look like a MAC address are passed through unchanged and
+    labelled 'Invalid'.
+    """
+
+    normalize = _normalize_mac
+    lookup = known_devices.get
+    is_mac = _MAC_RE.fullmatch
+    return [
+        (mac := normalize(raw), lookup(mac, "Unknown")) if is_mac(raw) else (raw, "Invalid")
+        for raw in macs
+    ]
@@ -2,26 +2,37 @@
 
 from __future__ import annotations
 
+import functools
+import queue
 import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .client import Site, UniFiClient, WlanProfile, label_mac_addresses
 
+SEARCH_DEBOUNCE_MS = 120
+
+
+def lowercase_entries(entries: List[tuple[str, str]]) -> List[tuple[str, str]]:
+    """Return lowercase copies of entries for repeated case-insensitive matching."""
+
+    return [(mac.lower(), name.lower()) for mac, name in entries]
+
+
+def filter_indices(lowered: List[tuple[str, str]], term: str) -> List[int]:
+    """Return positions of lowercase entries whose MAC or name contains the search term."""
+
+    needle = term.lower()
+    return [idx for idx, (mac, name) in enumerate(lowered) if needle in mac or needle in name]
+
 
 def filter_entries(entries: List[tuple[str, str]], term: str) -> List[tuple[str, str]]:
     """Return entries whose MAC or name contains the search term."""
 
     if not term:
         return list(entries)
-
-    needle = term.lower()
-    filtered: List[tuple[str, str]] = []
-    for mac, name in entries:
-        if needle in mac.lower() or needle in name.lower():
-            filtered.append((mac, name))
-    return filtered
+    return [entries[idx] for idx in filter_indices(lowercase_entries(entries), term)]
 
 
 class GuiState:
@@ -32,6 +43,27 @@ class GuiState:
         self.sites: List[Site] = []
         self.wlans: Dict[str, List[WlanProfile]] = {}
         self.known_devices: Dict[str, Dict[str, str]] = {}
+        self._label_cache: Dict[Tuple[int, int], List[tuple[str, str]]] = {}
+
+    def labelled_entries(self, wlan: WlanProfile, known: Dict[str, str]) -> List[tuple[str, str]]:
+        """Return labelled MACs for a WLAN, reusing the result on repeated selection."""
+
+        key = (id(wlan.mac_filter_list), id(known))
+        entries = self._label_cache.get(key)
+        if entries is None:
+            entries = label_mac_addresses(wlan.mac_filter_list, known)
+            self._label_cache[key] = entries
+        return entries
+
+    def store_site_data(self, site_code: str, wlans: List[WlanProfile], known: Dict[str, str]) -> None:
+        """Replace cached data for a site, dropping labels if the stored objects changed."""
+
+        if self.wlans.get(site_code) is wlans and self.known_devices.get(site_code) is known:
+            return
+        self.wlans[site_code] = wlans
+        self.known_devices[site_code] = known
+        # Cache keys are object ids, which may be reused once the old lists are collected.
+        self._label_cache.clear()
 
 
 class UnifiGui(tk.Tk):
@@ -56,7 +88,15 @@ class UnifiGui(tk.Tk):
         self._build_table()
 
         self._all_entries: List[tuple[str, str]] = []
-        self.search_var.trace_add("write", lambda *_: self._refresh_table())
+        self._all_entries_lc: List[tuple[str, str]] = []
+        self._item_ids: List[str] = []
+        self._search_after_id: Optional[str] = None
+
+        # Network calls run on one background worker; each new job supersedes pending ones.
+        self._jobs: queue.Queue = queue.Queue()
+        self._job_token = 0
+        threading.Thread(target=self._worker, daemon=True).start()
+        self.search_var.trace_add("write", lambda *_: self._schedule_refresh())
 
     # ------------------------------------------------------------------ UI setup
     def _build_form(self) -> None:
@@ -79,6 +119,9 @@ class UnifiGui(tk.Tk):
         self.site_combo = ttk.Combobox(container, textvariable=self.site_var, state="readonly")
         self.site_combo.grid(row=3, column=1, sticky=tk.EW, pady=4)
         self.site_combo.bind("<<ComboboxSelected>>", self.on_site_selected)
+        ttk.Button(container, text="Refresh", command=self.on_refresh).grid(
+            row=3, column=2, padx=(12, 0), sticky=tk.EW
+        )
 
         ttk.Label(container, text="WLAN").grid(row=4, column=0, sticky=tk.W, pady=4)
         self.wlan_combo = ttk.Combobox(container, textvariable=self.wlan_var, state="readonly")
@@ -117,6 +160,29 @@ class UnifiGui(tk.Tk):
         self.tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(fill=tk.Y, side=tk.RIGHT)
 
+    # ------------------------------------------------------------------ background jobs
+    def _submit(self, task: Callable[..., Optional[Callable[[], None]]], *args: Any) -> None:
+        """Queue ``task`` for the worker; it returns a UI callback to run on the Tk thread."""
+
+        self._job_token += 1
+        self._jobs.put((self._job_token, task, args))
+
+    def _worker(self) -> None:
+        while True:
+            token, task, args = self._jobs.get()
+            if token != self._job_token:
+                continue
+            try:
+                callback = task(*args)
+            except Exception as exc:  # pragma: no cover - UI message
+                callback = functools.partial(self._handle_error, "Unexpected error", str(exc))
+            if callback is not None:
+                self.after(0, self._deliver, token, callback)
+
+    def _deliver(self, token: int, callback: Callable[[], None]) -> None:
+        if token == self._job_token:
+            callback()
+
     # ------------------------------------------------------------------ callbacks
     def on_connect(self) -> None:
         url = self.url_var.get().strip()
@@ -128,16 +194,16 @@ class UnifiGui(tk.Tk):
             return
 
         self.status_var.set("Connecting...")
-        threading.Thread(target=self._connect_and_fetch_sites, args=(url, username, password), daemon=True).start()
+        self._submit(self._connect_and_fetch_sites, url, username, password)
 
-    def _connect_and_fetch_sites(self, url: str, username: str, password: str) -> None:
+    def _connect_and_fetch_sites(self, url: str, username: str, password: str) -> Callable[[], None]:
         try:
             client = UniFiClient(url)
             client.login(username, password)
             sites = client.fetch_sites()
         except Exception as exc:  # pragma: no cover - UI message
-            self.after(0, lambda: self._handle_error("Failed to connect", str(exc)))
-            return
+            message = str(exc)
+            return lambda: self._handle_error("Failed to connect", message)
 
         def update_ui() -> None:
             self.state.client = client
@@ -148,7 +214,7 @@ class UnifiGui(tk.Tk):
                 self.on_site_selected()
             self.status_var.set("Connected. Choose a site and WLAN.")
 
-        self.after(0, update_ui)
+        return update_ui
 
     def _handle_error(self, title: str, message: str) -> None:
         self.status_var.set(message)
@@ -160,22 +226,28 @@ class UnifiGui(tk.Tk):
             return
         site = self.state.sites[idx]
         self.status_var.set(f"Loading WLANs for {site.description}...")
-        threading.Thread(target=self._load_site_data, args=(site,), daemon=True).start()
+        self._submit(self._load_site_data, site)
 
-    def _load_site_data(self, site: Site) -> None:
+    def on_refresh(self) -> None:
         client = self.state.client
-        if client is None:
+        idx = self.site_combo.current()
+        if client is None or idx < 0:
             return
+        client.invalidate(self.state.sites[idx].code)
+        self.on_site_selected()
+
+    def _load_site_data(self, site: Site) -> Optional[Callable[[], None]]:
+        client = self.state.client
+        if client is None:
+            return None
         try:
-            wlans = client.fetch_wlans(site.code)
-            known = client.fetch_known_devices(site.code)
+            wlans, known = client.fetch_site_data(site.code)
         except Exception as exc:  # pragma: no cover - UI message
-            self.after(0, lambda: self._handle_error("Failed to load site", str(exc)))
-            return
+            message = str(exc)
+            return lambda: self._handle_error("Failed to load site", message)
 
         def update_ui() -> None:
-            self.state.wlans[site.code] = wlans
-            self.state.known_devices[site.code] = known
+            self.state.store_site_data(site.code, wlans, known)
             self.wlan_combo["values"] = [wlan.name for wlan in wlans]
             if wlans:
                 self.wlan_combo.current(0)
@@ -184,7 +256,7 @@ class UnifiGui(tk.Tk):
                 self._populate_table([])
                 self.status_var.set("No WLANs found for this site.")
 
-        self.after(0, update_ui)
+        return update_ui
 
     def on_wlan_selected(self, *_args: object) -> None:
         site_idx = self.site_combo.current()
@@ -197,19 +269,36 @@ class UnifiGui(tk.Tk):
             return
         wlan = wlans[wlan_idx]
         known = self.state.known_devices.get(site.code, {})
-        entries = label_mac_addresses(wlan.mac_filter_list, known)
+        entries = self.state.labelled_entries(wlan, known)
         self._populate_table(entries)
         self.status_var.set(f"Loaded {len(entries)} MAC addresses for {wlan.name}.")
 
     def _populate_table(self, entries: List[tuple[str, str]]) -> None:
         self._all_entries = list(entries)
+        self._all_entries_lc = lowercase_entries(self._all_entries)
+        # Build the row pool once; filtering only re-attaches existing items.
+        self.tree.delete(*self._item_ids)
+        self._item_ids = [self.tree.insert("", tk.END, values=entry) for entry in self._all_entries]
         self._refresh_table()
 
+    def _schedule_refresh(self) -> None:
+        """Refresh the table once typing in the filter box pauses."""
+
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._refresh_table)
+
     def _refresh_table(self) -> None:
-        entries = filter_entries(self._all_entries, self.search_var.get().strip())
-        self.tree.delete(*self.tree.get_children())
-        for mac, name in entries:
-            self.tree.insert("", tk.END, values=(mac, name))
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        term = self.search_var.get().strip()
+        if term:
+            visible = [self._item_ids[idx] for idx in filter_indices(self._all_entries_lc, term)]
+        else:
+            visible = self._item_ids
+        # A single Tcl call attaches the visible rows in order and detaches the rest.
+        self.tree.set_children("", *visible)
 
 
 def run_gui() -> int:
@@ -1,6 +1,8 @@
 """Unit tests for device labelling utilities."""
 
-from unifimacgui.client import label_mac_addresses
+import pytest
+
+from unifimacgui.client import UniFiClient, WlanProfile, label_mac_addresses
 
 
 def test_label_mac_addresses_resolves_known_devices() -> None:
@@ -17,3 +19,111 @@ def test_label_mac_addresses_resolves_known_devices() -> None:
         ("11:22:33:44:55:66".upper(), "Tablet"),
         ("77:88:99:AA:BB:CC", "Unknown"),
     ]
+
+
+def test_fetch_mac_filter_details_combines_site_data(monkeypatch) -> None:
+    client = UniFiClient("https://controller:8443/")
+    wlan = WlanProfile(name="Office", mac_filter_list=["AA:BB"])
+    monkeypatch.setattr(client, "fetch_wlans", lambda site: [wlan])
+    monkeypatch.setattr(client, "fetch_known_devices", lambda site: {"AA:BB": "Printer"})
+
+    assert client.fetch_mac_filter_details("default", "Office") == (wlan, {"AA:BB": "Printer"})
+    with pytest.raises(ValueError, match="Available: Office"):
+        client.fetch_mac_filter_details("default", "Guest")
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def test_fetch_known_devices_picks_first_non_blank_name(monkeypatch) -> None:
+    client = UniFiClient("https://controller:8443")
+    payload = (
+        b'{"data": ['
+        b'{"mac": "aa:bb", "name": "  ", "hostname": " laptop "},'
+        b'{"mac": "cc:dd", "name": null, "oui": "Apple"},'
+        b'{"mac": "ee:ff"},'
+        b'{"hostname": "no-mac"}'
+        b"]}"
+    )
+    monkeypatch.setattr(client.session, "get", lambda *args, **kwargs: _FakeResponse(payload))
+
+    assert client.fetch_known_devices("default") == {"AA:BB": "laptop", "CC:DD": "Apple"}
+
+
+def test_fetch_known_devices_is_cached_until_invalidated(monkeypatch) -> None:
+    client = UniFiClient("https://controller:8443")
+    calls = []
+
+    def fake_get(*args, **kwargs):
+        calls.append(args)
+        return _FakeResponse(b'{"data": [{"mac": "aa:bb", "name": "Printer"}]}')
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    first = client.fetch_known_devices("default")
+    assert client.fetch_known_devices("default") is first
+    assert len(calls) == 1
+
+    client.invalidate("default")
+    assert client.fetch_known_devices("default") == first
+    assert len(calls) == 2
+
+
+def test_label_mac_addresses_flags_malformed_entries() -> None:
+    known = {"AA:BB:CC:DD:EE:FF": "Laptop"}
+
+    labelled = label_mac_addresses(
+        [
+            "aa-bb-cc-dd-ee-ff",
+            "aabb.ccdd.eeff",
+            "aabbccddeeff",
+            "not a mac",
+            "aa:bb:cc:dd:ee:ff\n",
+            "aa:bb:cc:dd:ee",
+            "aa:bb:cc:dd",
+            "-----------",
+            "aa:bb-cc:dd:ee:ff",
+        ],
+        known,
+    )
+
+    assert labelled == [
+        ("AA-BB-CC-DD-EE-FF", "Unknown"),
+        ("AABB.CCDD.EEFF", "Unknown"),
+        ("AABBCCDDEEFF", "Unknown"),
+        ("not a mac", "Invalid"),
+        ("aa:bb:cc:dd:ee:ff\n", "Invalid"),
+        ("aa:bb:cc:dd:ee", "Invalid"),
+        ("aa:bb:cc:dd", "Invalid"),
+        ("-----------", "Invalid"),
+        ("aa:bb-cc:dd:ee:ff", "Invalid"),
+    ]
+
+
+def test_fetch_site_data_serves_fresh_cache_without_executor(monkeypatch) -> None:
+    client = UniFiClient("https://controller:8443")
+    payloads = {
+        "wlanconf": b'{"data": [{"name": "Office", "mac_filter_list": ["aa:bb"]}]}',
+        "alluser": b'{"data": [{"mac": "aa:bb", "name": "Printer"}]}',
+    }
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return _FakeResponse(payloads[url.rsplit("/", 1)[-1]])
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    wlans, known = client.fetch_site_data("default")
+    executor = client._executor
+    assert executor is not None
+    assert len(calls) == 2
+
+    assert client.fetch_site_data("default") == (wlans, known)
+    assert client._executor is executor
+    assert len(calls) == 2
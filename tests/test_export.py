@@ -0,0 +1,98 @@
+"""Tests for CLI export helpers."""
+
+import csv
+import io
+import sys
+import types
+import zipfile
+
+import pytest
+
+from unifimacgui import cli
+from unifimacgui.cli import export_results, print_table
+
+
+def test_export_results_txt_streams_generator(tmp_path) -> None:
+    outfile = tmp_path / "macs.txt"
+    entries = ((mac, name) for mac, name in [("AA:BB", "Laptop"), ("CC:DD", "Unknown")])
+
+    count = export_results(entries, str(outfile), "txt")
+
+    assert count == 2
+    assert outfile.read_text(encoding="utf-8") == "AA:BB\tLaptop\nCC:DD\tUnknown"
+
+
+def test_export_results_csv_writes_header_and_rows(tmp_path) -> None:
+    outfile = tmp_path / "macs.csv"
+
+    count = export_results(iter([("AA:BB", "Living Room, TV")]), str(outfile), "csv")
+
+    assert count == 1
+    assert outfile.read_text(encoding="utf-8").splitlines() == ["MAC,Name", 'AA:BB,"Living Room, TV"']
+
+
+def test_export_results_csv_matches_csv_module_quoting(tmp_path) -> None:
+    outfile = tmp_path / "macs.csv"
+    entries = [("AA:BB", "Plain"), ("CC:DD", 'Say "hi"'), ("EE:FF", "Two\nlines"), ("11:22", "Café")]
+    expected = io.StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(["MAC", "Name"])
+    writer.writerows(entries)
+
+    export_results(entries, str(outfile), "csv")
+
+    assert outfile.read_bytes() == expected.getvalue().encode("utf-8")
+
+
+def test_export_results_xlsx_writes_all_rows(tmp_path) -> None:
+    pytest.importorskip("xlsxwriter")
+    outfile = tmp_path / "macs.xlsx"
+
+    count = export_results([("AA:BB", "Laptop"), ("CC:DD", "Unknown")], str(outfile), "xlsx")
+
+    assert count == 2
+    with zipfile.ZipFile(outfile) as archive:
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    for value in ("MAC", "Name", "AA:BB", "Laptop", "CC:DD", "Unknown"):
+        assert f"<t>{value}</t>" in sheet
+
+
+def test_xlsx_writer_prefers_backends_in_order_and_caches_choice(monkeypatch) -> None:
+    rustpy = types.ModuleType("rustpy_xlsxwriter")
+    rustpy.FastExcel = object()
+    fake_xlsxwriter = types.ModuleType("xlsxwriter")
+    fake_pandas = types.ModuleType("pandas")
+    monkeypatch.setitem(sys.modules, "rustpy_xlsxwriter", rustpy)
+    monkeypatch.setitem(sys.modules, "xlsxwriter", fake_xlsxwriter)
+    monkeypatch.setitem(sys.modules, "pandas", fake_pandas)
+    cli._xlsx_writer.cache_clear()
+    try:
+        writer = cli._xlsx_writer()
+        assert writer.func is cli._write_xlsx_rustpy
+        assert writer.args == (rustpy.FastExcel,)
+        assert cli._xlsx_writer() is writer
+
+        monkeypatch.setitem(sys.modules, "rustpy_xlsxwriter", None)
+        cli._xlsx_writer.cache_clear()
+        writer = cli._xlsx_writer()
+        assert writer.func is cli._write_xlsx_xlsxwriter
+        assert writer.args == (fake_xlsxwriter,)
+
+        monkeypatch.setitem(sys.modules, "xlsxwriter", None)
+        cli._xlsx_writer.cache_clear()
+        writer = cli._xlsx_writer()
+        assert writer.func is cli._write_xlsx_pandas
+        assert writer.args == (fake_pandas,)
+    finally:
+        cli._xlsx_writer.cache_clear()
+
+
+def test_print_table_aligns_columns(capsys) -> None:
+    print_table([("AA:BB:CC:DD:EE:FF", "Printer"), ("11:22:33:44:55:66", "Kitchen Camera")])
+
+    assert capsys.readouterr().out.splitlines() == [
+        "MAC                Name          ",
+        "-----------------  --------------",
+        "AA:BB:CC:DD:EE:FF  Printer       ",
+        "11:22:33:44:55:66  Kitchen Camera",
+    ]
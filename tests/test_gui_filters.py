@@ -1,6 +1,7 @@
 """Tests for GUI helper utilities."""
 
-from unifimacgui.gui import filter_entries
+from unifimacgui.client import WlanProfile
+from unifimacgui.gui import GuiState, filter_entries, filter_indices, lowercase_entries
 
 
 def test_filter_entries_returns_all_for_empty_term() -> None:
@@ -17,3 +18,36 @@ def test_filter_entries_matches_mac_and_name_case_insensitive() -> None:
 
     assert filter_entries(entries, "printer") == [entries[0]]
     assert filter_entries(entries, "22:33") == [entries[1]]
+
+
+def test_gui_state_reuses_labelled_entries_until_site_data_objects_change() -> None:
+    state = GuiState()
+    wlan = WlanProfile(name="Office", mac_filter_list=["aa:bb:cc:dd:ee:ff"])
+    known = {"AA:BB:CC:DD:EE:FF": "Printer"}
+    wlans = [wlan]
+    state.store_site_data("default", wlans, known)
+
+    first = state.labelled_entries(wlan, known)
+
+    assert first == [("AA:BB:CC:DD:EE:FF", "Printer")]
+    assert state.labelled_entries(wlan, known) is first
+
+    state.store_site_data("default", wlans, known)
+    assert state.labelled_entries(wlan, known) is first
+
+    new_known = {"AA:BB:CC:DD:EE:FF": "Scanner"}
+    state.store_site_data("default", wlans, new_known)
+    assert state.labelled_entries(wlan, new_known) == [("AA:BB:CC:DD:EE:FF", "Scanner")]
+    assert state.labelled_entries(wlan, known) is not first
+
+
+def test_lowercase_entries_lowers_mac_and_name() -> None:
+    entries = [("AA:BB", "Living Room"), ("CC:DD", "Office")]
+
+    assert lowercase_entries(entries) == [("aa:bb", "living room"), ("cc:dd", "office")]
+
+
+def test_filter_indices_returns_matching_positions() -> None:
+    lowered = [("aa:bb", "living room"), ("cc:dd", "office"), ("ee:ff", "room 2")]
+
+    assert filter_indices(lowered, "ROOM") == [0, 2]